@@ -7,10 +7,49 @@ Parses tips from both main and dev branches, plus GitHub issues with
 """
 
 import json
+import os
 import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, List, Tuple, NamedTuple, Any
+from typing import (
+    Dict, Iterator, List, Optional, Set, Tuple, NamedTuple, Any
+)
+
+
+# Environment for git subprocesses, built once: no pager, no locale
+# specific output
+_GIT_ENV = {**os.environ, "GIT_PAGER": "cat", "LC_ALL": "C"}
+
+# HTML media patterns
+_IMG_RE = re.compile(r'<img[^>]*>', re.IGNORECASE)
+_VIDEO_RE = re.compile(r'<video[^>]*>.*?</video>', re.DOTALL | re.IGNORECASE)
+_AUDIO_RE = re.compile(r'<audio[^>]*>.*?</audio>', re.DOTALL | re.IGNORECASE)
+_MEDIA_END_RES = {
+    tag: re.compile(rf'</{tag}\s*>', re.IGNORECASE)
+    for tag in ('video', 'audio')
+}
+
+# Markdown cleanup patterns
+_MD_IMG_RE = re.compile(r'!\[[^\]]*\]\([^)]+\)')
+_CODE_FENCE_RE = re.compile(r'```\w*\s*')
+
+# Number of words kept from tip and issue bodies
+_BODY_WORDS = 50
+
+# Parsed tips are cached by blob SHA between runs. Bump the version
+# whenever parsing changes so stale entries are discarded.
+_CACHE_FILE = Path(".catalogue_cache.json")
+_CACHE_VERSION = 4
+
+# Translation table escaping pipes in markdown table cells
+_PIPE_ESCAPE = str.maketrans({'|': '\\|'})
+
+_TIP_FILE_RE = re.compile(r'(\d+)\.html')
+_TIP_REQUEST_RE = re.compile(r'^\s*\[tip request\]\s*', re.IGNORECASE)
+_GH_REMOTE_RE = re.compile(r'github\.com[:/]([^/]+)/([^/\.]+)')
 
 
 class TipInfo(NamedTuple):
@@ -21,119 +60,276 @@ class TipInfo(NamedTuple):
     state: str
 
 
-def get_git_files(branch: str, path_pattern: str) -> List[str]:
-    """Get list of files matching pattern from specified git branch."""
+def get_git_blobs(branch: str, path_pattern: str) -> List[Tuple[str, str]]:
+    """Get (blob SHA, path) pairs matching pattern from specified git branch."""
     try:
+        # Let git filter by path, paths from the repository root
         result = subprocess.run(
-            ["git", "ls-tree", "-r", "--name-only", branch],
+            ["git", "ls-tree", "-r", "-z", "--full-tree",
+             "--format=%(objecttype) %(objectname) %(path)",
+             branch, "--", path_pattern.rstrip('*')],
             capture_output=True,
-            text=True,
-            check=True
+            check=True,
+            env=_GIT_ENV
         )
-        all_files = [f.strip() for f in result.stdout.split('\n') if f.strip()]
-        # Filter files that match the pattern
-        return [f for f in all_files if f.startswith(path_pattern.rstrip('*'))]
     except subprocess.CalledProcessError:
         return []
 
-
-def get_file_content_from_branch(branch: str, file_path: str) -> str:
-    """Get content of a file from specified git branch."""
-    try:
-        result = subprocess.run(
-            ["git", "show", f"{branch}:{file_path}"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout
-    except subprocess.CalledProcessError:
-        return ""
-
-
-def extract_html_body(content: str) -> str:
-    """Extract and clean body content from HTML, truncated to 50 words."""
-    # Remove script and style elements
-    content = re.sub(
-        r'<(script|style)[^>]*>.*?</\1>', '', content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
-
-    # Replace media elements with placeholders
-    content = re.sub(r'<img[^>]*>', '<image>', content, flags=re.IGNORECASE)
-    content = re.sub(
-        r'<video[^>]*>.*?</video>', '<video>', content,
-        flags=re.DOTALL | re.IGNORECASE
+    blobs = []
+    for entry in result.stdout.decode('utf-8', 'replace').split('\0'):
+        if not entry:
+            continue
+        object_type, sha, file_path = entry.split(' ', 2)
+        if object_type == 'blob':
+            blobs.append((sha, file_path))
+    return blobs
+
+
+def iter_blob_contents(
+    blobs: List[Tuple[str, str]]
+) -> Iterator[Tuple[str, str, str]]:
+    """Yield (blob SHA, path, content) for several (blob SHA, path) pairs.
+
+    All blobs are read by SHA through a single `git cat-file --batch`
+    process, so git does not need to resolve the paths again. Requests
+    are written from a background thread, so each file can be processed
+    while git is still reading the next ones. Missing blobs are skipped.
+    """
+    process = subprocess.Popen(
+        ["git", "cat-file", "--batch"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=_GIT_ENV
     )
-    content = re.sub(
-        r'<audio[^>]*>.*?</audio>', '<audio>', content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
-
-    # Remove all HTML tags but keep the text content
-    text_content = re.sub(r'<[^>]+>', ' ', content)
 
-    # Clean up whitespace
-    text_content = re.sub(r'\s+', ' ', text_content.strip())
+    def write_requests() -> None:
+        try:
+            for sha, _ in blobs:
+                process.stdin.write(f"{sha}\n".encode())
+            process.stdin.close()
+        except BrokenPipeError:
+            pass  # Reading stopped early
 
-    # Truncate to 50 words
-    words = text_content.split()
-    if len(words) > 50:
-        text_content = ' '.join(words[:50]) + '...'
+    writer = threading.Thread(target=write_requests, daemon=True)
+    writer.start()
 
-    return text_content
+    try:
+        for sha, file_path in blobs:
+            # Header is "<sha> blob <size>", or "<sha> missing"
+            header = process.stdout.readline()
+            if not header or header.endswith(b' missing\n'):
+                continue
+
+            size = int(header.split()[2])
+            content = process.stdout.read(size)
+            process.stdout.read(1)  # Trailing newline
+            yield sha, file_path, content.decode('utf-8', 'replace')
+    finally:
+        process.stdout.close()
+        writer.join()
+        process.wait()
+
+
+class _StopParsing(Exception):
+    """Raised by TipHTMLParser once it has found everything it needs."""
+
+
+class TipHTMLParser(HTMLParser):
+    """Extract the title and the start of the body text from tip HTML.
+
+    The title is the text of the first <h1>. The body is the document
+    text, truncated to 50 words: script and style contents are removed,
+    closed media elements are dropped along with their contents and every
+    other tag separates words. Character references are kept as written.
+
+    The whole document must be passed to a single feed() call, as media
+    elements are only dropped if a matching end tag follows them.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.title = None
+        self.words = []
+        self._text = []
+        self._title_text = None
+        self._inert = None
+        self._media = None
+        self._source = ''
+        self._line_starts = None
+
+    def feed(self, data):
+        self._source = data
+        self._line_starts = None
+        super().feed(data)
+
+    def _offset(self) -> int:
+        """Offset in the source of the markup being handled."""
+        # Only media elements and references need offsets, so the table
+        # of line starts is built on first use
+        if self._line_starts is None:
+            self._line_starts = [0]
+            newline = self._source.find('\n')
+            while newline >= 0:
+                self._line_starts.append(newline + 1)
+                newline = self._source.find('\n', newline + 1)
+
+        line, column = self.getpos()
+        return self._line_starts[line - 1] + column
+
+    def _source_ref(self, length: int) -> str:
+        """Source text of the reference being handled, with its ';' if any."""
+        start = self._offset()
+        end = start + length
+        if self._source.startswith(';', end):
+            end += 1
+        return self._source[start:end]
+
+    def _break_words(self) -> None:
+        """End the current run of body and title text at a tag boundary."""
+        if len(self.words) <= _BODY_WORDS:
+            self.words.extend(''.join(self._text).split())
+        self._text = []
+        if self._title_text is not None:
+            self._title_text.append(' ')
+        if len(self.words) > _BODY_WORDS and self.title is not None:
+            raise _StopParsing
+
+    def handle_starttag(self, tag, attrs):
+        if self._inert or self._media:
+            return
+        if tag in ('script', 'style'):
+            self._inert = tag
+            return
+
+        self._break_words()
+        if tag in ('video', 'audio'):
+            # Unclosed media elements are treated like any other tag
+            if _MEDIA_END_RES[tag].search(self._source, self._offset()):
+                self._media = tag
+        elif tag == 'h1' and self.title is None and self._title_text is None:
+            self._title_text = []
+
+    def handle_endtag(self, tag):
+        if self._inert:
+            if tag == self._inert:
+                self._inert = None
+            return
+        if self._media:
+            if tag == self._media:
+                self._media = None
+            return
+
+        if tag == 'h1' and self._title_text is not None:
+            self.title = ' '.join(''.join(self._title_text).split())
+            self._title_text = None
+        self._break_words()
+
+    def handle_data(self, data):
+        if self._inert or self._media:
+            return
+        self._text.append(data)
+        if self._title_text is not None:
+            self._title_text.append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(self._source_ref(len(name) + 1))
+
+    def handle_charref(self, name):
+        self.handle_data(self._source_ref(len(name) + 2))
+
+    def handle_comment(self, data):
+        self.handle_decl(data)
+
+    def handle_decl(self, decl):
+        if not (self._inert or self._media):
+            self._break_words()
+
+    def unknown_decl(self, data):
+        self.handle_decl(data)
+
+    def parse_marked_section(self, i, report=1):
+        try:
+            return super().parse_marked_section(i, report)
+        except AssertionError:
+            pass
+
+        # html.parser rejects marked sections with unknown keywords, skip
+        # them up to their "]]>" (or ">") and carry on parsing
+        end = self.rawdata.find(']]>', i + 3)
+        if end >= 0:
+            end += 3
+        else:
+            end = self.rawdata.find('>', i + 3)
+            if end < 0:
+                return -1
+            end += 1
+
+        if report:
+            self.unknown_decl(self.rawdata[i + 3:end])
+        return end
+
+    @property
+    def body(self) -> str:
+        """Body text collected so far, truncated to 50 words."""
+        words = self.words
+        if len(words) <= _BODY_WORDS:
+            words = words + ''.join(self._text).split()
+        if len(words) > _BODY_WORDS:
+            return ' '.join(words[:_BODY_WORDS]) + '...'
+        return ' '.join(words)
 
 
 def filter_media_tags(text: str) -> str:
     """Filter HTML and markdown image/media tags and replace with placeholders."""
     # Replace HTML image tags
-    text = re.sub(r'<img[^>]*>', '&lt;image&gt;', text, flags=re.IGNORECASE)
+    text = _IMG_RE.sub('&lt;image&gt;', text)
 
     # Replace HTML video tags
-    text = re.sub(
-        r'<video[^>]*>.*?</video>', '&lt;video&gt;', text,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    text = _VIDEO_RE.sub('&lt;video&gt;', text)
 
     # Replace HTML audio tags
-    text = re.sub(
-        r'<audio[^>]*>.*?</audio>', '&lt;audio&gt;', text,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    text = _AUDIO_RE.sub('&lt;audio&gt;', text)
 
     # Replace markdown images: ![alt text](url) or ![alt text](url "title")
-    text = re.sub(r'!\[[^\]]*\]\([^)]+\)', '&lt;image&gt;', text)
+    text = _MD_IMG_RE.sub('&lt;image&gt;', text)
 
     # Remove code block markers (```language and ```)
-    text = re.sub(r'```\w*\s*', '', text)
-    text = re.sub(r'```', '', text)
+    text = _CODE_FENCE_RE.sub('', text)
 
     # Remove inline code markers
-    text = re.sub(r'`([^`]+)`', r'\1', text)
+    text = text.replace('`', '')
 
     return text
 
 
-def extract_tip_info(content: str, file_path: str) -> Tuple[int, str, str]:
-    """Extract tip number, title, and body from HTML content."""
-    # Extract tip number from filename
+def get_tip_number(file_path: str) -> int:
+    """Extract tip number from the filename of a tip."""
     filename = Path(file_path).name
-    tip_match = re.match(r'(\d+)\.html', filename)
+    tip_match = _TIP_FILE_RE.match(filename)
     if not tip_match:
         raise ValueError(f"Cannot extract tip number from {filename}")
 
-    tip_number = int(tip_match.group(1))
+    return int(tip_match.group(1))
 
-    # Extract title from h1 tag
-    h1_match = re.search(r'<h1[^>]*>\s*(.*?)\s*</h1>', content, re.DOTALL)
-    if not h1_match:
-        title = "No title found"
-    else:
-        # Clean up the title - remove extra whitespace and newlines
-        title = re.sub(r'\s+', ' ', h1_match.group(1).strip())
 
-    # Extract body content
-    body = extract_html_body(content)
+def extract_tip_info(content: str, file_path: str) -> Tuple[int, str, str]:
+    """Extract tip number, title, and body from HTML content."""
+    tip_number = get_tip_number(file_path)
+
+    # Extract title from h1 tag and body content, in one parse
+    parser = TipHTMLParser()
+    try:
+        parser.feed(content)
+        parser.close()
+    except _StopParsing:
+        pass
+    except AssertionError as e:
+        # html.parser gives up on some malformed markup, keep what was
+        # collected up to that point
+        print(f"Warning: Could not fully parse {file_path}: {e}")
+
+    title = parser.title if parser.title is not None else "No title found"
+    body = parser.body
 
     # Filter media tags
     body = filter_media_tags(body)
@@ -141,6 +337,40 @@ def extract_tip_info(content: str, file_path: str) -> Tuple[int, str, str]:
     return tip_number, title, body
 
 
+def search_github_issues(
+    owner: str, repo: str, token: str
+) -> List[Dict[str, Any]]:
+    """Search open issues with '[tip request]' in the title via GitHub API.
+
+    Returns an empty list, with a warning, if the search fails.
+    """
+    # Only needed when a token is set, so not imported at module level
+    import http.client
+    import urllib.parse
+    import urllib.request
+
+    query = urllib.parse.urlencode({
+        'q': f'repo:{owner}/{repo} is:issue state:open in:title '
+             '"[tip request]"',
+        'sort': 'created',
+        'order': 'desc',
+        'per_page': 100,
+    })
+    request = urllib.request.Request(
+        f"https://api.github.com/search/issues?{query}",
+        headers={
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+        }
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.load(response)['items']
+    except (OSError, http.client.HTTPException, ValueError, KeyError):
+        print("Warning: Could not search GitHub issues")
+        return []
+
+
 def get_github_issues() -> List[TipInfo]:
     """Fetch GitHub issues with '[tip request]' titles."""
     try:
@@ -148,17 +378,15 @@ def get_github_issues() -> List[TipInfo]:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
             capture_output=True,
-            text=True,
-            check=True
+            check=True,
+            env=_GIT_ENV
         )
-        remote_url = result.stdout.strip()
+        remote_url = result.stdout.decode('utf-8', 'replace').strip()
 
         # Extract owner/repo from URL
         if 'github.com' in remote_url:
             # Handle both SSH and HTTPS URLs
-            repo_match = re.search(
-                r'github\.com[:/]([^/]+)/([^/\.]+)', remote_url
-            )
+            repo_match = _GH_REMOTE_RE.search(remote_url)
             if repo_match:
                 owner, repo = repo_match.groups()
             else:
@@ -168,38 +396,41 @@ def get_github_issues() -> List[TipInfo]:
             print("Warning: Remote is not a GitHub repository")
             return []
 
-        # Use GitHub CLI if available
-        try:
-            result = subprocess.run(
-                ["gh", "issue", "list", "--repo", f"{owner}/{repo}",
-                 "--state", "open", "--json", "number,title,body"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            issues_data = json.loads(result.stdout)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Warning: GitHub CLI not available or not authenticated")
-            return []
+        # Query the GitHub API directly when a token is available,
+        # otherwise use GitHub CLI if available
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            issues_data = search_github_issues(owner, repo, token)
+        else:
+            try:
+                result = subprocess.run(
+                    ["gh", "issue", "list", "--repo", f"{owner}/{repo}",
+                     "--state", "open", "--json", "number,title,body"],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+                issues_data = json.loads(result.stdout)
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                print("Warning: GitHub CLI not available or not authenticated")
+                return []
 
         tip_issues = []
         for issue in issues_data:
             title = issue.get('title', '')
-            if re.match(r'^\s*\[tip request\]', title, re.IGNORECASE):
+            if _TIP_REQUEST_RE.match(title):
                 # Clean title (remove [tip request] prefix)
-                clean_title = re.sub(
-                    r'^\s*\[tip request\]\s*', '', title, flags=re.IGNORECASE
-                ).strip()
+                clean_title = _TIP_REQUEST_RE.sub('', title).strip()
 
                 # Truncate body to 50 words and clean formatting
                 body = issue.get('body', '') or ''
                 # Replace newlines with spaces and clean up
-                body = re.sub(r'\s+', ' ', body.strip())
+                body = ' '.join(body.split())
                 # Filter media tags
                 body = filter_media_tags(body)
                 words = body.split()
-                if len(words) > 50:
-                    body = ' '.join(words[:50]) + '...'
+                if len(words) > _BODY_WORDS:
+                    body = ' '.join(words[:_BODY_WORDS]) + '...'
 
                 tip_issues.append(TipInfo(
                     number=0,  # Use 0 to indicate no assigned tip number
@@ -215,106 +446,163 @@ def get_github_issues() -> List[TipInfo]:
         return []
 
 
-def parse_tips_from_branch(branch: str, state: str) -> Dict[int, TipInfo]:
-    """Parse all tips from a given branch."""
+def parse_tip_blob(
+    blob: Tuple[str, str, str]
+) -> Tuple[str, Optional[Tuple[int, str, str]]]:
+    """Parse a (blob SHA, path, content) tip into (blob SHA, tip info).
+
+    Tip info is None if the tip is empty or cannot be parsed.
+    """
+    sha, file_path, content = blob
+    if not content:
+        return sha, None
+
+    try:
+        return sha, extract_tip_info(content, file_path)
+    except ValueError as e:
+        print(f"Warning: {e}")
+        return sha, None
+
+
+def load_cache() -> Dict[str, List[str]]:
+    """Load cached [title, body] of parsed tips, keyed by blob SHA."""
+    try:
+        with open(_CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if cache.get('version') != _CACHE_VERSION:
+        return {}
+    return cache.get('tips', {})
+
+
+def save_cache(cache: Dict[str, List[str]]) -> None:
+    """Save cached [title, body] of parsed tips, keyed by blob SHA."""
+    with open(_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump({'version': _CACHE_VERSION, 'tips': cache}, f)
+
+
+def parse_tips_from_branch(
+    branch: str, state: str, cache: Dict[str, List[str]],
+    seen_shas: Set[str]
+) -> Dict[int, TipInfo]:
+    """Parse all tips from a given branch.
+
+    Tips whose blob SHA is in the cache are not fetched or parsed again;
+    newly parsed tips are added to the cache. The blob SHAs of all tips
+    on the branch are added to seen_shas.
+    """
     tips = {}
 
     # Get all HTML files in tips/ directory
-    tip_files = get_git_files(branch, "tips/")
+    tip_blobs = get_git_blobs(branch, "tips/")
+    seen_shas.update(sha for sha, _ in tip_blobs)
 
-    for file_path in tip_files:
-        content = get_file_content_from_branch(branch, file_path)
-        if content:
-            try:
-                tip_number, title, body = extract_tip_info(content, file_path)
-                tips[tip_number] = TipInfo(
-                    number=tip_number,
-                    title=title,
-                    body=body,
-                    state=state
-                )
-            except ValueError as e:
-                print(f"Warning: {e}")
+    uncached_blobs = [
+        (sha, file_path) for sha, file_path in tip_blobs if sha not in cache
+    ]
 
-    return tips
+    # Parse the remaining tips in worker threads as git streams them in
+    parsed = {}
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(
+            parse_tip_blob, iter_blob_contents(uncached_blobs)
+        )
+        for sha, tip_info in results:
+            if tip_info:
+                _, title, body = tip_info
+                parsed[sha] = [title, body]
+
+    # Combine cached and parsed tips in ls-tree order, so the same file
+    # wins when several map to one tip number, whatever was cached
+    for sha, file_path in tip_blobs:
+        if sha in parsed:
+            cache[sha] = parsed[sha]
+        elif sha not in cache:
+            continue
 
+        try:
+            tip_number = get_tip_number(file_path)
+        except ValueError as e:
+            print(f"Warning: {e}")
+            continue
+
+        title, body = cache[sha]
+        tips[tip_number] = TipInfo(
+            number=tip_number,
+            title=title,
+            body=body,
+            state=state
+        )
 
-def generate_catalogue(all_tips: Dict[Any, TipInfo]) -> str:
-    """Generate CATALOGUE.md content."""
-    # Create catalogue content
-    content = [
-        "# Galaxy Tips Catalogue",
-        "",
-        "| Tip # | Title | Body | State |",
-        "|-------|-------|------|-------|"
-    ]
+    return tips
 
-    # Separate numbered tips from issues
-    numbered_tips = {}
-    issue_tips = []
 
-    for key, tip in all_tips.items():
-        if isinstance(key, int):
-            numbered_tips[key] = tip
-        else:  # This is an issue
-            issue_tips.append(tip)
+def generate_catalogue(
+    numbered_tips: Dict[int, TipInfo], issue_tips: List[TipInfo]
+) -> Iterator[str]:
+    """Generate CATALOGUE.md content, one line at a time."""
+    yield "# Galaxy Tips Catalogue"
+    yield ""
+    yield "| Tip # | Title | Body | State |"
+    yield "|-------|-------|------|-------|"
 
     # Add numbered tips first (sorted by number)
-    for tip_num in sorted(numbered_tips.keys()):
-        tip = numbered_tips[tip_num]
+    for tip_num, tip in sorted(numbered_tips.items()):
         # Escape pipe characters in content for markdown table
-        title = tip.title.replace('|', '\\|')
-        body = tip.body.replace('|', '\\|')
+        title = tip.title.translate(_PIPE_ESCAPE)
+        body = tip.body.translate(_PIPE_ESCAPE)
 
-        content.append(f"| {tip_num} | {title} | {body} | {tip.state} |")
+        yield f"| {tip_num} | {title} | {body} | {tip.state} |"
 
     # Add issues with blank numbers
     for tip in issue_tips:
         # Escape pipe characters in content for markdown table
-        title = tip.title.replace('|', '\\|')
-        body = tip.body.replace('|', '\\|')
-
-        content.append(f"|  | {title} | {body} | {tip.state} |")
+        title = tip.title.translate(_PIPE_ESCAPE)
+        body = tip.body.translate(_PIPE_ESCAPE)
 
-    return "\n".join(content) + "\n"
+        yield f"|  | {title} | {body} | {tip.state} |"
 
 
 def main():
     """Main function to generate the catalogue."""
-    all_tips = {}
-
-    # Parse tips from both branches
-    print("Parsing tips from main branch...")
-    main_tips = parse_tips_from_branch("origin/main", "production")
-
-    print("Parsing tips from dev branch...")
-    dev_tips = parse_tips_from_branch("origin/dev", "draft")
+    cache = load_cache()
+    seen_shas = set()
+
+    # Parse tips from both branches and fetch GitHub issues concurrently,
+    # as each mostly waits on a subprocess
+    print("Parsing tips from main and dev branches, fetching GitHub issues...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        main_future = executor.submit(
+            parse_tips_from_branch, "origin/main", "production", cache,
+            seen_shas
+        )
+        dev_future = executor.submit(
+            parse_tips_from_branch, "origin/dev", "draft", cache, seen_shas
+        )
+        issues_future = executor.submit(get_github_issues)
 
-    # Fetch GitHub issues
-    print("Fetching GitHub issues...")
-    github_issues = get_github_issues()
+        main_tips = main_future.result()
+        dev_tips = dev_future.result()
+        github_issues = issues_future.result()
 
-    # Combine all tips, with main branch taking precedence over dev
-    all_tips.update(dev_tips)  # Add dev tips first
-    all_tips.update(main_tips)  # Main tips override dev tips
+    # Only keep cached tips that are still on one of the branches
+    save_cache({sha: tip for sha, tip in cache.items() if sha in seen_shas})
 
-    # Add GitHub issues separately (they don't have assigned tip numbers)
-    issue_counter = 0
-    for issue in github_issues:
-        # Use negative numbers to avoid conflicts with real tip numbers
-        issue_key = f"issue_{issue_counter}"
-        all_tips[issue_key] = issue
-        issue_counter += 1
+    # Combine all tips, with main branch taking precedence over dev.
+    # GitHub issues are kept separately (they don't have assigned tip numbers)
+    numbered_tips = {**dev_tips, **main_tips}
 
     print(f"Found {len(main_tips)} tips in main, {len(dev_tips)} tips in dev, "
           f"{len(github_issues)} GitHub issues")
 
-    # Generate catalogue
-    catalogue_content = generate_catalogue(all_tips)
-
-    # Write to file
-    with open("CATALOGUE.md", "w") as f:
-        f.write(catalogue_content)
+    # Generate catalogue, writing it to file as it is generated
+    with open("CATALOGUE.md", "w", encoding="utf-8", newline="\n") as f:
+        f.writelines(
+            f"{line}\n"
+            for line in generate_catalogue(numbered_tips, github_issues)
+        )
 
     print("CATALOGUE.md generated successfully!")
 